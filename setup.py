@@ -2,6 +2,17 @@
 
 from setuptools import setup, find_packages
 
+# Compile the style-format hot path when Cython is available; the package
+# falls back to the pure-Python implementation otherwise
+try:
+    from Cython.Build import cythonize
+    ext_modules = cythonize(
+        ["src/styles_gallery/formats/common_format_cy.pyx"],
+        language_level=3,
+    )
+except ImportError:
+    ext_modules = []
+
 setup(
     name="styles-gallery",
     version="20250602_000000_0_1_0_2",
@@ -10,6 +21,7 @@ setup(
     long_description="Universal style format and image save engine for consistent plotting across all major Python plotting libraries",
     packages=find_packages(where="src"),
     package_dir={"": "src"},
+    ext_modules=ext_modules,
     python_requires=">=3.7",
     install_requires=[
         "matplotlib>=3.0.0",
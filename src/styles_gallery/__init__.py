@@ -1,41 +1,45 @@
 """Styles Gallery - Universal plotting style management"""
 
-from .formats.common_format import UniversalStyleFormat, UNIVERSAL_STYLE_SCHEMA
+import importlib
+
+from .formats import UniversalStyleFormat, UNIVERSAL_STYLE_SCHEMA
 
 __version__ = "20250602_000000_0_1_0_4"
+
+# Heavy or optional public names resolved lazily (PEP 562) so
+# `import styles_gallery` does not pull in matplotlib/plotly/bokeh or the
+# template registry for callers that only need the style format itself.
+_LAZY_ATTRIBUTES = {
+    "UniversalImageEngine": ".image_engine",
+    "save_image": ".image_engine",
+    "MatplotlibAdapter": ".adapters.matplotlib_adapter",
+    "PlotlyAdapter": ".adapters.plotly_adapter",
+    "BokehAdapter": ".adapters.bokeh_adapter",
+    "StyleTemplateManager": ".templates",
+    "ACADEMIC_STYLES": ".templates",
+    "PRESENTATION_STYLES": ".templates",
+    "PUBLICATION_STYLES": ".templates",
+    "OptimizedStyleFormat": ".performance_cache",
+    "get_cache_stats": ".performance_cache",
+    "clear_all_caches": ".performance_cache",
+}
+
 __all__ = [
-    "UniversalStyleFormat", 
-    "UNIVERSAL_STYLE_SCHEMA"
-]
-
-# Optional imports that require external libraries
-try:
-    from .image_engine import UniversalImageEngine, save_image
-    __all__.extend(["UniversalImageEngine", "save_image"])
-except ImportError:
-    UniversalImageEngine = None
-    save_image = None
-
-try:
-    from .adapters import MatplotlibAdapter, PlotlyAdapter, BokehAdapter
-    if MatplotlibAdapter:
-        __all__.append("MatplotlibAdapter")
-    if PlotlyAdapter:
-        __all__.append("PlotlyAdapter")
-    if BokehAdapter:
-        __all__.append("BokehAdapter")
-except ImportError:
-    pass
-
-# Advanced features
-try:
-    from .templates import StyleTemplateManager, ACADEMIC_STYLES, PRESENTATION_STYLES, PUBLICATION_STYLES
-    __all__.extend(["StyleTemplateManager", "ACADEMIC_STYLES", "PRESENTATION_STYLES", "PUBLICATION_STYLES"])
-except ImportError:
-    pass
-
-try:
-    from .performance_cache import OptimizedStyleFormat, get_cache_stats, clear_all_caches
-    __all__.extend(["OptimizedStyleFormat", "get_cache_stats", "clear_all_caches"])
-except ImportError:
-    pass
\ No newline at end of file
+    "UniversalStyleFormat",
+    "UNIVERSAL_STYLE_SCHEMA",
+] + list(_LAZY_ATTRIBUTES)
+
+
+def __getattr__(name):
+    """Resolve lazy attributes on first access and cache them in globals()."""
+    module_path = _LAZY_ATTRIBUTES.get(name)
+    if module_path is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module = importlib.import_module(module_path, __name__)
+    attr = getattr(module, name)
+    globals()[name] = attr
+    return attr
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES))
@@ -1,22 +1,27 @@
 """Plotting library adapters for universal style format"""
 
-# Optional imports for plotting library adapters
-__all__ = []
+import importlib
 
-try:
-    from .matplotlib_adapter import MatplotlibAdapter
-    __all__.append("MatplotlibAdapter")
-except ImportError:
-    MatplotlibAdapter = None
+# Adapter classes resolved lazily (PEP 562) so importing this package does
+# not load matplotlib, plotly, and bokeh up front.
+_ADAPTER_MODULES = {
+    "MatplotlibAdapter": ".matplotlib_adapter",
+    "PlotlyAdapter": ".plotly_adapter",
+    "BokehAdapter": ".bokeh_adapter",
+}
 
-try:
-    from .plotly_adapter import PlotlyAdapter
-    __all__.append("PlotlyAdapter")
-except ImportError:
-    PlotlyAdapter = None
+__all__ = list(_ADAPTER_MODULES)
 
-try:
-    from .bokeh_adapter import BokehAdapter
-    __all__.append("BokehAdapter")
-except ImportError:
-    BokehAdapter = None
\ No newline at end of file
+
+def __getattr__(name):
+    module_path = _ADAPTER_MODULES.get(name)
+    if module_path is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module = importlib.import_module(module_path, __name__)
+    attr = getattr(module, name)
+    globals()[name] = attr
+    return attr
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_ADAPTER_MODULES))
@@ -1,31 +1,102 @@
 """Bokeh adapter for universal style format"""
 
-from typing import Dict, Any, Optional, Union
-from bokeh.plotting import figure, Figure
-from bokeh.models import Range1d
-from bokeh.io import export_png, export_svgs
-import bokeh.palettes as palettes
-from ..formats.common_format import UniversalStyleFormat
+import importlib.util
+import logging
+import os
+from typing import TYPE_CHECKING, Dict, Any, Optional
+from functools import lru_cache
+from ..formats import UniversalStyleFormat
+from ..image_engine import _ensure_ext
+
+if TYPE_CHECKING:
+    from bokeh.plotting import Figure
+
+logger = logging.getLogger(__name__)
+
+
+@lru_cache(maxsize=1)
+def _has_selenium() -> bool:
+    """Probe once per process whether selenium (needed for PNG/SVG export)
+    is installed, without importing it"""
+    return importlib.util.find_spec('selenium') is not None
+
+
+@lru_cache(maxsize=1)
+def _plotting():
+    """Import bokeh.plotting on first use to keep module import cheap"""
+    from bokeh import plotting
+    return plotting
+
+
+@lru_cache(maxsize=1)
+def _io():
+    """Import bokeh.io export helpers on first use"""
+    from bokeh import io
+    return io
+
+
+@lru_cache(maxsize=1)
+def _palettes():
+    """Import bokeh.palettes on first use"""
+    import bokeh.palettes as palettes
+    return palettes
+
+
+@lru_cache(maxsize=32)
+def _viridis(n: int) -> tuple:
+    """Fetch a viridis palette of n colors once per size"""
+    return tuple(_palettes().Viridis[n])
 
 
 class BokehAdapter:
     """Adapter to apply universal styles to bokeh figures"""
-    
+
+    __slots__ = ('_style_format', '_figure_config', '_base_palette',
+                 '_title_pt', '_label_pt', '_default_pt', '_font_family')
+
     def __init__(self, style_format: Optional[UniversalStyleFormat] = None):
-        self.style_format = style_format or UniversalStyleFormat()
-    
+        self._style_format = style_format or UniversalStyleFormat()
+        self._figure_config: Optional[Dict[str, Any]] = None
+        self._base_palette: Optional[list] = None
+        self._recompute_font_cache()
+
+    @property
+    def style_format(self) -> UniversalStyleFormat:
+        """Style format driving this adapter"""
+        return self._style_format
+
+    @style_format.setter
+    def style_format(self, value: UniversalStyleFormat) -> None:
+        self._style_format = value
+        self._figure_config = None
+        self._base_palette = None
+        self._recompute_font_cache()
+
+    def _recompute_font_cache(self) -> None:
+        """Precompute the font strings apply_style assigns per figure so the
+        hot path avoids rebuilding f-strings and re-walking the schema"""
+        font_config = self.style_format.get_font_config()
+        font_sizes = font_config["size"]
+        self._title_pt = f"{font_sizes['title']}pt"
+        self._label_pt = f"{font_sizes['label']}pt"
+        self._default_pt = f"{font_sizes['default']}pt"
+        self._font_family = font_config["family"]
+
     def get_figure_config(self) -> Dict[str, Any]:
         """Generate bokeh figure configuration from universal style"""
-        
+
+        if self._figure_config is not None:
+            return self._figure_config
+
         figure_config = self.style_format.schema["figure"]
         font_config = self.style_format.get_font_config()
         color_config = self.style_format.get_color_config()
         layout_config = self.style_format.get_layout_config()
-        
+
         # Convert size from inches to pixels (assuming 96 dpi for web)
         width_px = int(figure_config["size"]["width"] * 96)
         height_px = int(figure_config["size"]["height"] * 96)
-        
+
         config = {
             'width': width_px,
             'height': height_px,
@@ -35,110 +106,122 @@ class BokehAdapter:
             'toolbar_location': None,
             'outline_line_color': None
         }
-        
+
+        self._figure_config = config
         return config
-    
+
     def get_color_palette(self) -> list:
         """Get color palette for bokeh"""
-        color_config = self.style_format.get_color_config()
-        
-        if color_config["palette"] == "viridis":
-            return palettes.Viridis[8]
-        else:
-            return [color_config["primary"], color_config["secondary"]]
-    
-    def apply_style(self, fig: Figure) -> Figure:
+        palette = self._base_palette
+        if palette is None:
+            color_config = self.style_format.get_color_config()
+            if color_config["palette"] == "viridis":
+                palette = list(_viridis(8))
+            else:
+                palette = [color_config["primary"], color_config["secondary"]]
+            self._base_palette = palette
+        return palette
+
+    def apply_style(self, fig: 'Figure') -> 'Figure':
         """Apply universal style to bokeh figure"""
-        
-        font_config = self.style_format.get_font_config()
+
         color_config = self.style_format.get_color_config()
-        layout_config = self.style_format.get_layout_config()
-        
+        grid_config = self.style_format.get_layout_config()["grid"]
+        font_family = self._font_family
+        label_pt = self._label_pt
+        default_pt = self._default_pt
+
         # Set title style if exists
         if fig.title:
-            fig.title.text_font_size = f"{font_config['size']['title']}pt"
-            fig.title.text_font = font_config["family"]
-        
+            fig.title.text_font_size = self._title_pt
+            fig.title.text_font = font_family
+
         # Set axis styles
-        for axis in [fig.xaxis, fig.yaxis]:
-            axis.axis_label_text_font_size = f"{font_config['size']['label']}pt"
-            axis.axis_label_text_font = font_config["family"]
-            axis.major_label_text_font_size = f"{font_config['size']['default']}pt"
-            axis.major_label_text_font = font_config["family"]
-        
+        for axis in (fig.xaxis, fig.yaxis):
+            axis.axis_label_text_font_size = label_pt
+            axis.axis_label_text_font = font_family
+            axis.major_label_text_font_size = default_pt
+            axis.major_label_text_font = font_family
+
         # Set grid styles
         fig.grid.grid_line_color = color_config["grid"]
-        fig.grid.grid_line_alpha = layout_config["grid"]["alpha"]
-        fig.grid.grid_line_width = layout_config["grid"]["linewidth"]
-        
+        fig.grid.grid_line_alpha = grid_config["alpha"]
+        fig.grid.grid_line_width = grid_config["linewidth"]
+
         return fig
-    
-    def create_figure(self, plot_type: str = 'line', **kwargs) -> Figure:
+
+    def create_figure(self, plot_type: str = 'line', **kwargs) -> 'Figure':
         """Create a new bokeh figure with universal style applied"""
-        
-        config = self.get_figure_config()
+
+        # Copy so per-call kwargs never leak into the cached config
+        config = dict(self.get_figure_config())
         config.update(kwargs)
-        
-        fig = figure(**config)
+
+        fig = _plotting().figure(**config)
         return self.apply_style(fig)
-    
-    def save_figure(self, fig: Figure, filename: str, format: str = 'png', 
+
+    def save_figure(self, fig: 'Figure', filename: str, format: str = 'png',
                    quality: str = 'high', metadata: Optional[Dict[str, Any]] = None) -> None:
         """Save bokeh figure with universal settings"""
-        
+
         # Determine file extension
-        if not filename.lower().endswith(f'.{format}'):
-            filename = f"{filename}.{format}"
-        
-        if format.lower() == 'png':
-            # Set high DPI for quality
-            dpi = self.style_format.get_dpi() if quality == 'high' else 150
-            
-            # Note: bokeh export_png requires selenium and chromedriver
-            try:
-                export_png(fig, filename=filename)
-            except Exception as e:
-                print(f"PNG export failed: {e}")
-                print("Note: PNG export requires selenium and chromedriver")
-                # Fallback to HTML
-                fig.output_to_static_html(filename.replace('.png', '.html'))
-        
-        elif format.lower() == 'svg':
+        fmt = format.lower()
+        filename = _ensure_ext(filename, fmt)
+
+        if fmt in ('png', 'svg'):
+            # bokeh's export_png/export_svgs need selenium and chromedriver;
+            # short-circuit to the HTML fallback when selenium is missing so
+            # batch runs skip an exception per figure
+            if not _has_selenium():
+                logger.warning(
+                    "%s export requires selenium and chromedriver; "
+                    "saving HTML instead", fmt.upper()
+                )
+                self._save_html(fig, os.path.splitext(filename)[0] + '.html')
+                return
+
             try:
-                export_svgs(fig, filename=filename)
-            except Exception as e:
-                print(f"SVG export failed: {e}")
+                if fmt == 'png':
+                    _io().export_png(fig, filename=filename)
+                else:
+                    _io().export_svgs(fig, filename=filename)
+            except Exception:
+                logger.warning("%s export failed; saving HTML instead",
+                               fmt.upper(), exc_info=True)
                 # Fallback to HTML
-                fig.output_to_static_html(filename.replace('.svg', '.html'))
-        
-        elif format.lower() == 'html':
-            from bokeh.plotting import output_file, save
-            output_file(filename)
-            save(fig)
-        
+                self._save_html(fig, os.path.splitext(filename)[0] + '.html')
+
+        elif fmt == 'html':
+            self._save_html(fig, filename)
+
         else:
             raise ValueError(f"Unsupported format for bokeh: {format}")
-    
-    def set_color_palette(self, fig: Figure, num_colors: int = 8) -> list:
+
+    def _save_html(self, fig: 'Figure', filename: str) -> None:
+        """Write a figure as a standalone HTML file"""
+        plotting = _plotting()
+        plotting.output_file(filename)
+        plotting.save(fig)
+
+    def set_color_palette(self, fig: 'Figure', num_colors: int = 8) -> list:
         """Set color palette for bokeh figure"""
         colors = self.get_color_palette()
-        
+
         # Extend palette if needed
         if len(colors) < num_colors:
             if self.style_format.get_color_config()["palette"] == "viridis":
-                colors = palettes.Viridis[max(num_colors, 3)]
+                colors = list(_viridis(max(num_colors, 3)))
             else:
                 # Cycle through available colors
                 colors = colors * (num_colors // len(colors) + 1)
-        
+
         return colors[:num_colors]
-    
+
     def create_multi_figure(self, nrows: int = 1, ncols: int = 1) -> list:
         """Create multiple bokeh figures arranged in grid"""
-        figures = []
-        
-        for i in range(nrows * ncols):
-            fig = self.create_figure()
-            figures.append(fig)
-        
-        return figures
\ No newline at end of file
+        # Assemble the config and resolve the figure constructor once instead
+        # of re-running the create_figure copy/update per grid cell
+        config = self.get_figure_config()
+        figure = _plotting().figure
+
+        return [self.apply_style(figure(**config)) for _ in range(nrows * ncols)]
@@ -1,53 +1,75 @@
 """Matplotlib adapter for universal style format"""
 
-from typing import Dict, Any, Optional
-import matplotlib.pyplot as plt
-import matplotlib as mpl
-from ..formats.common_format import UniversalStyleFormat
+from typing import TYPE_CHECKING, Dict, Any, Optional
+from functools import lru_cache
+from ..formats import UniversalStyleFormat
+
+if TYPE_CHECKING:
+    import matplotlib.pyplot as plt
+
+
+@lru_cache(maxsize=1)
+def _plt():
+    """Import matplotlib.pyplot on first use to keep module import cheap"""
+    import matplotlib.pyplot as plt
+    return plt
 
 
 class MatplotlibAdapter:
     """Adapter to apply universal styles to matplotlib figures"""
-    
+
+    __slots__ = ('style_format',)
+
     def __init__(self, style_format: Optional[UniversalStyleFormat] = None):
         self.style_format = style_format or UniversalStyleFormat()
-    
-    def apply_style(self, fig: Optional[plt.Figure] = None, ax: Optional[plt.Axes] = None) -> None:
+
+    def apply_style(self, fig: Optional['plt.Figure'] = None, ax: Optional['plt.Axes'] = None) -> None:
         """Apply universal style to matplotlib figure/axes"""
-        
+
+        plt = _plt()
+
         # Apply to current figure if none provided
         if fig is None:
             fig = plt.gcf()
         if ax is None:
             ax = plt.gca()
-        
+
         # Set figure properties
         figure_config = self.style_format.schema["figure"]
         fig.set_size_inches(figure_config["size"]["width"], figure_config["size"]["height"])
         fig.set_dpi(figure_config["dpi"])
         fig.patch.set_facecolor(figure_config["background"])
-        
-        # Set font properties
+
+        # Set font properties on the figure's own artists instead of mutating
+        # the global rcParams; global updates revalidate every key, leak style
+        # into unrelated figures, and are not safe for parallel batch saves
         font_config = self.style_format.get_font_config()
-        plt.rcParams.update({
-            'font.family': font_config["family"],
-            'font.size': font_config["size"]["default"],
-            'axes.titlesize': font_config["size"]["title"],
-            'axes.labelsize': font_config["size"]["label"],
-            'font.weight': font_config["weight"]
-        })
-        
+        family = font_config["family"]
+        sizes = font_config["size"]
+        weight = font_config["weight"]
+
+        ax.title.set_fontsize(sizes["title"])
+        ax.title.set_fontfamily(family)
+        ax.title.set_fontweight(weight)
+        for label in (ax.xaxis.label, ax.yaxis.label):
+            label.set_fontsize(sizes["label"])
+            label.set_fontfamily(family)
+            label.set_fontweight(weight)
+        for tick in ax.get_xticklabels() + ax.get_yticklabels():
+            tick.set_fontsize(sizes["default"])
+            tick.set_fontfamily(family)
+
         # Set color properties
         color_config = self.style_format.get_color_config()
         ax.set_facecolor(figure_config["background"])
-        
+
         # Set grid properties
         layout_config = self.style_format.get_layout_config()
         if "grid" in layout_config:
-            ax.grid(True, alpha=layout_config["grid"]["alpha"], 
+            ax.grid(True, alpha=layout_config["grid"]["alpha"],
                    linewidth=layout_config["grid"]["linewidth"],
                    color=color_config["grid"])
-        
+
         # Set margins
         margins = layout_config["margins"]
         fig.subplots_adjust(
@@ -56,12 +78,13 @@ class MatplotlibAdapter:
             top=1-margins["top"],
             bottom=margins["bottom"]
         )
-    
+
     def set_color_palette(self, palette_name: Optional[str] = None) -> None:
         """Set color palette for matplotlib"""
+        plt = _plt()
         color_config = self.style_format.get_color_config()
         palette = palette_name or color_config["palette"]
-        
+
         # Set default color cycle
         if palette == "viridis":
             colors = plt.cm.viridis([0.1, 0.3, 0.5, 0.7, 0.9])
@@ -70,22 +93,23 @@ class MatplotlibAdapter:
             # Set custom colors
             colors = [color_config["primary"], color_config["secondary"]]
             plt.rcParams['axes.prop_cycle'] = plt.cycler('color', colors)
-    
+
     def create_figure(self) -> tuple:
         """Create a new figure with universal style applied"""
+        plt = _plt()
         size = self.style_format.get_figure_size()
         dpi = self.style_format.get_dpi()
-        
+
         fig, ax = plt.subplots(figsize=size, dpi=dpi)
         self.apply_style(fig, ax)
         self.set_color_palette()
-        
+
         return fig, ax
-    
-    def save_figure(self, fig: plt.Figure, filename: str, format: str = 'png', 
+
+    def save_figure(self, fig: 'plt.Figure', filename: str, format: str = 'png',
                    quality: str = 'high', metadata: Optional[Dict[str, Any]] = None) -> None:
         """Save matplotlib figure with universal settings"""
-        
+
         save_kwargs = {
             'format': format,
             'dpi': self.style_format.get_dpi() if quality == 'high' else 150,
@@ -93,8 +117,8 @@ class MatplotlibAdapter:
             'facecolor': self.style_format.schema["figure"]["background"],
             'edgecolor': 'none'
         }
-        
+
         if metadata:
             save_kwargs['metadata'] = metadata
-        
-        fig.savefig(filename, **save_kwargs)
\ No newline at end of file
+
+        fig.savefig(filename, **save_kwargs)
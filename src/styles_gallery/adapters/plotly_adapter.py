@@ -1,121 +1,182 @@
 """Plotly adapter for universal style format"""
 
-from typing import Dict, Any, Optional, Union
-import plotly.graph_objects as go
-import plotly.io as pio
-from ..formats.common_format import UniversalStyleFormat
+from typing import TYPE_CHECKING, Dict, Any, Optional
+from functools import lru_cache
+from ..formats import UniversalStyleFormat
+from ..image_engine import _ensure_ext
+
+if TYPE_CHECKING:
+    import plotly.graph_objects as go
+
+
+@lru_cache(maxsize=1)
+def _go():
+    """Import plotly.graph_objects on first use to keep module import cheap"""
+    import plotly.graph_objects as go
+    return go
+
+
+# Which colorable attribute each trace class exposes, probed once per class
+# so styling loops skip plotly's __getattr__ machinery on repeat traces
+_TRACE_COLOR_ATTRS: Dict[type, Optional[str]] = {}
+
+
+def _trace_color_attr(trace) -> Optional[str]:
+    cls = type(trace)
+    try:
+        return _TRACE_COLOR_ATTRS[cls]
+    except KeyError:
+        if hasattr(trace, 'marker'):
+            attr = 'marker'
+        elif hasattr(trace, 'line'):
+            attr = 'line'
+        else:
+            attr = None
+        _TRACE_COLOR_ATTRS[cls] = attr
+        return attr
 
 
 class PlotlyAdapter:
     """Adapter to apply universal styles to plotly figures"""
-    
+
+    __slots__ = ('_style_format', '_layout', '_palette')
+
     def __init__(self, style_format: Optional[UniversalStyleFormat] = None):
-        self.style_format = style_format or UniversalStyleFormat()
-    
+        self._style_format = style_format or UniversalStyleFormat()
+        self._layout: Optional[Dict[str, Any]] = None
+        self._palette: Optional[list] = None
+
+    @property
+    def style_format(self) -> UniversalStyleFormat:
+        """Style format driving this adapter"""
+        return self._style_format
+
+    @style_format.setter
+    def style_format(self, value: UniversalStyleFormat) -> None:
+        self._style_format = value
+        self._layout = None
+        self._palette = None
+
     def get_layout_config(self) -> Dict[str, Any]:
         """Generate plotly layout configuration from universal style"""
-        
+
         figure_config = self.style_format.schema["figure"]
         font_config = self.style_format.get_font_config()
         color_config = self.style_format.get_color_config()
         layout_config = self.style_format.get_layout_config()
-        
+
         # Convert size from inches to pixels (assuming 96 dpi for web)
         width_px = int(figure_config["size"]["width"] * 96)
         height_px = int(figure_config["size"]["height"] * 96)
-        
+
+        # Hoist the nested lookups the layout dict reads more than once
+        background = figure_config["background"]
+        font_sizes = font_config["size"]
+        label_size = font_sizes["label"]
+        grid_color = color_config["grid"]
+        grid_width = layout_config["grid"]["linewidth"]
+        margins = layout_config["margins"]
+
         layout = {
             'width': width_px,
             'height': height_px,
-            'paper_bgcolor': figure_config["background"],
-            'plot_bgcolor': figure_config["background"],
+            'paper_bgcolor': background,
+            'plot_bgcolor': background,
             'font': {
                 'family': font_config["family"],
-                'size': font_config["size"]["default"],
+                'size': font_sizes["default"],
                 'color': 'black'
             },
             'title': {
-                'font': {'size': font_config["size"]["title"]}
+                'font': {'size': font_sizes["title"]}
             },
             'xaxis': {
-                'title': {'font': {'size': font_config["size"]["label"]}},
+                'title': {'font': {'size': label_size}},
                 'showgrid': True,
-                'gridcolor': color_config["grid"],
-                'gridwidth': layout_config["grid"]["linewidth"],
+                'gridcolor': grid_color,
+                'gridwidth': grid_width,
                 'zeroline': False
             },
             'yaxis': {
-                'title': {'font': {'size': font_config["size"]["label"]}},
+                'title': {'font': {'size': label_size}},
                 'showgrid': True,
-                'gridcolor': color_config["grid"],
-                'gridwidth': layout_config["grid"]["linewidth"],
+                'gridcolor': grid_color,
+                'gridwidth': grid_width,
                 'zeroline': False
             },
             'margin': {
-                'l': int(layout_config["margins"]["left"] * width_px),
-                'r': int(layout_config["margins"]["right"] * width_px),
-                't': int(layout_config["margins"]["top"] * height_px),
-                'b': int(layout_config["margins"]["bottom"] * height_px)
+                'l': int(margins["left"] * width_px),
+                'r': int(margins["right"] * width_px),
+                't': int(margins["top"] * height_px),
+                'b': int(margins["bottom"] * height_px)
             }
         }
-        
+
         return layout
-    
+
     def get_color_palette(self) -> list:
         """Get color palette for plotly"""
         color_config = self.style_format.get_color_config()
-        
+
         if color_config["palette"] == "viridis":
             return ['#440154', '#31688e', '#35b779', '#fde725']
         else:
             return [color_config["primary"], color_config["secondary"]]
-    
-    def apply_style(self, fig: go.Figure) -> go.Figure:
+
+    def apply_style(self, fig: 'go.Figure') -> 'go.Figure':
         """Apply universal style to plotly figure"""
-        
-        layout_config = self.get_layout_config()
+
+        # The style format rarely changes, so assemble the layout dict and
+        # palette once and reuse them for every styled figure
+        layout_config = self._layout
+        if layout_config is None:
+            layout_config = self._layout = self.get_layout_config()
         fig.update_layout(**layout_config)
-        
+
         # Apply color palette to traces
-        colors = self.get_color_palette()
+        colors = self._palette
+        if colors is None:
+            colors = self._palette = self.get_color_palette()
+        n = len(colors)
         for i, trace in enumerate(fig.data):
-            if hasattr(trace, 'marker'):
-                trace.marker.color = colors[i % len(colors)]
-            elif hasattr(trace, 'line'):
-                trace.line.color = colors[i % len(colors)]
-        
+            attr = _trace_color_attr(trace)
+            if attr is not None:
+                getattr(trace, attr).color = colors[i % n]
+
         return fig
-    
-    def create_figure(self, figure_type: str = 'scatter') -> go.Figure:
+
+    def create_figure(self, figure_type: str = 'scatter') -> 'go.Figure':
         """Create a new plotly figure with universal style applied"""
-        
+
+        go = _go()
+
         if figure_type == 'scatter':
             fig = go.Figure()
         elif figure_type == 'bar':
             fig = go.Figure()
         else:
             fig = go.Figure()
-        
+
         return self.apply_style(fig)
-    
-    def save_figure(self, fig: go.Figure, filename: str, format: str = 'png', 
+
+    def save_figure(self, fig: 'go.Figure', filename: str, format: str = 'png',
                    quality: str = 'high', metadata: Optional[Dict[str, Any]] = None) -> None:
         """Save plotly figure with universal settings"""
-        
+
         # Determine file extension
-        if not filename.lower().endswith(f'.{format}'):
-            filename = f"{filename}.{format}"
-        
+        fmt = format.lower()
+        filename = _ensure_ext(filename, fmt)
+
         # Set image parameters
         width = self.style_format.schema["figure"]["size"]["width"]
         height = self.style_format.schema["figure"]["size"]["height"]
         dpi = self.style_format.get_dpi()
-        
+
         # Convert inches to pixels
         width_px = int(width * dpi)
         height_px = int(height * dpi)
-        
-        if format.lower() in ['png', 'jpg', 'jpeg', 'svg', 'pdf']:
+
+        if fmt in ('png', 'jpg', 'jpeg', 'svg', 'pdf'):
             fig.write_image(
                 filename,
                 format=format,
@@ -123,14 +184,14 @@ class PlotlyAdapter:
                 height=height_px,
                 scale=1 if quality == 'high' else 0.5
             )
-        elif format.lower() == 'html':
+        elif fmt == 'html':
             fig.write_html(filename)
         else:
             raise ValueError(f"Unsupported format: {format}")
-    
-    def create_subplot_figure(self, rows: int = 1, cols: int = 1) -> go.Figure:
+
+    def create_subplot_figure(self, rows: int = 1, cols: int = 1) -> 'go.Figure':
         """Create plotly subplot figure with universal style"""
         from plotly.subplots import make_subplots
-        
+
         fig = make_subplots(rows=rows, cols=cols)
-        return self.apply_style(fig)
\ No newline at end of file
+        return self.apply_style(fig)
@@ -0,0 +1,15 @@
+"""Universal style format specification"""
+
+from .common_format import UNIVERSAL_STYLE_SCHEMA
+
+# Prefer the Cython-compiled accessors when the extension was built;
+# fall back to the pure-Python implementation otherwise.
+try:
+    from .common_format_cy import UniversalStyleFormat
+except ImportError:
+    from .common_format import UniversalStyleFormat
+
+__all__ = [
+    "UniversalStyleFormat",
+    "UNIVERSAL_STYLE_SCHEMA"
+]
@@ -1,8 +1,30 @@
 # Universal style format specification
 from typing import Dict, Any, Optional
-from dataclasses import dataclass
+import copy
 import json
 from datetime import datetime
+from types import MappingProxyType
+
+# orjson serializes the schema several times faster than stdlib json;
+# fall back transparently when it is not installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _dumps(schema: Dict[str, Any]) -> str:
+    """Serialize a schema dict (or read-only proxy view) to indented JSON"""
+    if orjson is not None:
+        return orjson.dumps(schema, option=orjson.OPT_INDENT_2, default=dict).decode()
+    return json.dumps(schema, indent=2, default=dict)
+
+
+def _loads(data) -> Dict[str, Any]:
+    """Parse a schema dict from a JSON string or bytes"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
 
 UNIVERSAL_STYLE_SCHEMA = {
     "version": "1.0",
@@ -34,52 +56,121 @@ UNIVERSAL_STYLE_SCHEMA = {
     }
 }
 
-@dataclass
+def _freeze(value):
+    """Recursively wrap dicts in read-only mapping proxies"""
+    if isinstance(value, dict):
+        return MappingProxyType({k: _freeze(v) for k, v in value.items()})
+    return value
+
+
+def _thaw(value):
+    """Recursively convert a frozen schema back to mutable dicts/lists"""
+    if isinstance(value, (MappingProxyType, dict)):
+        return {k: _thaw(v) for k, v in value.items()}
+    if isinstance(value, tuple):
+        return [_thaw(v) for v in value]
+    return value
+
+
+# Shared read-only view of the default schema; default-constructed instances
+# reference it instead of shallow-copying (which silently shared - and could
+# silently mutate - the nested dicts of the module-level schema)
+_DEFAULT_SCHEMA = _freeze(UNIVERSAL_STYLE_SCHEMA)
+
+
 class UniversalStyleFormat:
     """Universal style format for consistent plotting across libraries"""
-    
+
+    # Galleries hold many preset instances; slots drop the per-instance
+    # __dict__ and speed up attribute access on the accessor hot path
+    __slots__ = ('_schema', '_computed')
+
     def __init__(self, schema: Optional[Dict[str, Any]] = None):
-        self.schema = schema or UNIVERSAL_STYLE_SCHEMA.copy()
-    
+        self._schema = _DEFAULT_SCHEMA if schema is None else schema
+        self._computed: Dict[str, Any] = {}
+
+    @property
+    def schema(self) -> Dict[str, Any]:
+        """Underlying style schema dictionary"""
+        return self._schema
+
+    @schema.setter
+    def schema(self, value: Dict[str, Any]) -> None:
+        self.set_schema(value)
+
+    def set_schema(self, value: Dict[str, Any]) -> None:
+        """Replace the schema and drop memoized values; subclasses hook
+        their invalidation here rather than extending the property, which
+        the compiled variant exposes as a plain getset descriptor"""
+        self._schema = value
+        self._computed.clear()
+
+    def _own_schema(self) -> Dict[str, Any]:
+        """Get a privately owned, mutable schema dict, thawing the shared
+        default or a frozen template on first write access"""
+        if self._schema is _DEFAULT_SCHEMA:
+            self._schema = copy.deepcopy(UNIVERSAL_STYLE_SCHEMA)
+            self._computed.clear()
+        elif isinstance(self._schema, MappingProxyType):
+            # Frozen built-in templates are read-only views too
+            self._schema = _thaw(self._schema)
+            self._computed.clear()
+        return self._schema
+
     def get_figure_size(self) -> tuple:
         """Get figure size as tuple (width, height)"""
-        size = self.schema["figure"]["size"]
-        return (size["width"], size["height"])
-    
+        size = self._computed.get('figure_size')
+        if size is None:
+            raw = self._schema["figure"]["size"]
+            size = self._computed['figure_size'] = (raw["width"], raw["height"])
+        return size
+
     def get_dpi(self) -> int:
         """Get figure DPI"""
-        return self.schema["figure"]["dpi"]
-    
+        dpi = self._computed.get('dpi')
+        if dpi is None:
+            dpi = self._computed['dpi'] = self._schema["figure"]["dpi"]
+        return dpi
+
     def get_font_config(self) -> Dict[str, Any]:
         """Get font configuration"""
-        return self.schema["fonts"]
-    
+        config = self._computed.get('fonts')
+        if config is None:
+            config = self._computed['fonts'] = self._schema["fonts"]
+        return config
+
     def get_color_config(self) -> Dict[str, Any]:
         """Get color configuration"""
-        return self.schema["colors"]
-    
+        config = self._computed.get('colors')
+        if config is None:
+            config = self._computed['colors'] = self._schema["colors"]
+        return config
+
     def get_layout_config(self) -> Dict[str, Any]:
         """Get layout configuration"""
-        return self.schema["layout"]
+        config = self._computed.get('layout')
+        if config is None:
+            config = self._computed['layout'] = self._schema["layout"]
+        return config
     
     def to_json(self) -> str:
         """Export style to JSON string"""
-        return json.dumps(self.schema, indent=2)
-    
+        return _dumps(self.schema)
+
     @classmethod
     def from_json(cls, json_str: str) -> 'UniversalStyleFormat':
         """Create style from JSON string"""
-        schema = json.loads(json_str)
+        schema = _loads(json_str)
         return cls(schema)
-    
+
     def save_to_file(self, filepath: str) -> None:
         """Save style to JSON file"""
         with open(filepath, 'w') as f:
             f.write(self.to_json())
-    
+
     @classmethod
     def load_from_file(cls, filepath: str) -> 'UniversalStyleFormat':
         """Load style from JSON file"""
-        with open(filepath, 'r') as f:
-            json_str = f.read()
-        return cls.from_json(json_str)
\ No newline at end of file
+        with open(filepath, 'rb') as f:
+            json_bytes = f.read()
+        return cls(_loads(json_bytes))
\ No newline at end of file
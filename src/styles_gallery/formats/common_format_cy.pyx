@@ -0,0 +1,109 @@
+# cython: language_level=3
+"""Cython-compiled mirror of the UniversalStyleFormat hot path.
+
+Keep this in sync with common_format.py; formats/__init__.py falls back to
+the pure-Python class when the extension has not been built.
+"""
+
+import copy
+from types import MappingProxyType
+
+from .common_format import UNIVERSAL_STYLE_SCHEMA, _DEFAULT_SCHEMA, _dumps, _loads, _thaw
+
+
+cdef class UniversalStyleFormat:
+    """Universal style format for consistent plotting across libraries"""
+
+    # readonly so Python subclasses (e.g. OptimizedStyleFormat) can read
+    # the schema and clear the memo; rebinding still goes through methods
+    cdef readonly object _schema
+    cdef readonly dict _computed
+
+    def __init__(self, schema=None):
+        self._schema = _DEFAULT_SCHEMA if schema is None else schema
+        self._computed = {}
+
+    @property
+    def schema(self):
+        """Underlying style schema dictionary"""
+        return self._schema
+
+    @schema.setter
+    def schema(self, value):
+        self.set_schema(value)
+
+    def set_schema(self, value):
+        """Replace the schema and drop memoized values; Python subclasses
+        hook their invalidation here"""
+        self._schema = value
+        self._computed.clear()
+
+    def _own_schema(self):
+        """Get a privately owned, mutable schema dict, thawing the shared
+        default or a frozen template on first write access"""
+        if self._schema is _DEFAULT_SCHEMA:
+            self._schema = copy.deepcopy(UNIVERSAL_STYLE_SCHEMA)
+            self._computed.clear()
+        elif isinstance(self._schema, MappingProxyType):
+            # Frozen built-in templates are read-only views too
+            self._schema = _thaw(self._schema)
+            self._computed.clear()
+        return self._schema
+
+    def get_figure_size(self):
+        """Get figure size as tuple (width, height)"""
+        size = self._computed.get('figure_size')
+        if size is None:
+            raw = self._schema["figure"]["size"]
+            size = self._computed['figure_size'] = (raw["width"], raw["height"])
+        return size
+
+    def get_dpi(self):
+        """Get figure DPI"""
+        dpi = self._computed.get('dpi')
+        if dpi is None:
+            dpi = self._computed['dpi'] = self._schema["figure"]["dpi"]
+        return dpi
+
+    def get_font_config(self):
+        """Get font configuration"""
+        config = self._computed.get('fonts')
+        if config is None:
+            config = self._computed['fonts'] = self._schema["fonts"]
+        return config
+
+    def get_color_config(self):
+        """Get color configuration"""
+        config = self._computed.get('colors')
+        if config is None:
+            config = self._computed['colors'] = self._schema["colors"]
+        return config
+
+    def get_layout_config(self):
+        """Get layout configuration"""
+        config = self._computed.get('layout')
+        if config is None:
+            config = self._computed['layout'] = self._schema["layout"]
+        return config
+
+    def to_json(self):
+        """Export style to JSON string"""
+        return _dumps(self._schema)
+
+    @classmethod
+    def from_json(cls, json_str):
+        """Create style from JSON string"""
+        schema = _loads(json_str)
+        return cls(schema)
+
+    def save_to_file(self, filepath):
+        """Save style to JSON file"""
+        with open(filepath, 'w') as f:
+            f.write(self.to_json())
+
+    @classmethod
+    def load_from_file(cls, filepath):
+        """Load style from JSON file"""
+        with open(filepath, 'rb') as f:
+            json_bytes = f.read()
+        return cls(_loads(json_bytes))
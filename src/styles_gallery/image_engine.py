@@ -2,13 +2,36 @@
 
 from typing import Dict, Any, Optional, Union
 import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import cached_property, lru_cache
 from pathlib import Path
 from datetime import datetime
 
-from .formats.common_format import UniversalStyleFormat
-from .adapters.matplotlib_adapter import MatplotlibAdapter
-from .adapters.plotly_adapter import PlotlyAdapter
-from .adapters.bokeh_adapter import BokehAdapter
+from .formats import UniversalStyleFormat
+
+# Top-level package name -> figure type, plus a per-class cache so repeated
+# saves of the same figure class skip the module-name inspection entirely
+_FIGURE_MODULES = {
+    'matplotlib': 'matplotlib',
+    'plotly': 'plotly',
+    'bokeh': 'bokeh'
+}
+_TYPE_CACHE: Dict[type, str] = {}
+
+
+@lru_cache(maxsize=16)
+def _format_suffix(format: str) -> str:
+    """Cache the '.fmt' suffix for a format string"""
+    return f".{format.lower()}"
+
+
+def _ensure_ext(filename: str, format: str) -> str:
+    """Append the format extension unless the filename already carries it"""
+    suffix = _format_suffix(format)
+    if os.path.splitext(filename)[1].lower() == suffix:
+        return filename
+    return filename + suffix
 
 
 class UniversalImageEngine:
@@ -16,27 +39,45 @@ class UniversalImageEngine:
     
     def __init__(self, style_format: Optional[UniversalStyleFormat] = None):
         self.style_format = style_format or UniversalStyleFormat()
-        self.matplotlib_adapter = MatplotlibAdapter(self.style_format)
-        self.plotly_adapter = PlotlyAdapter(self.style_format)
-        self.bokeh_adapter = BokehAdapter(self.style_format)
+        self._created_dirs: set = set()
+        # matplotlib styling/saving touches global state (plt.rcParams), so
+        # parallel batch saves serialize matplotlib figures through this lock
+        self._mpl_lock = threading.Lock()
+
+    # Adapters are created on first use so saving a figure from one library
+    # does not pay the import cost of the other two plotting stacks
+    @cached_property
+    def matplotlib_adapter(self):
+        from .adapters.matplotlib_adapter import MatplotlibAdapter
+        return MatplotlibAdapter(self.style_format)
+
+    @cached_property
+    def plotly_adapter(self):
+        from .adapters.plotly_adapter import PlotlyAdapter
+        return PlotlyAdapter(self.style_format)
+
+    @cached_property
+    def bokeh_adapter(self):
+        from .adapters.bokeh_adapter import BokehAdapter
+        return BokehAdapter(self.style_format)
     
     def detect_figure_type(self, figure) -> str:
         """Detect the type of plotting library used for the figure"""
-        
-        figure_type = type(figure).__module__
-        
-        if 'matplotlib' in figure_type:
-            return 'matplotlib'
-        elif 'plotly' in figure_type:
-            return 'plotly'
-        elif 'bokeh' in figure_type:
-            return 'bokeh'
-        else:
-            raise ValueError(f"Unsupported figure type: {type(figure)}")
+
+        cls = type(figure)
+        figure_type = _TYPE_CACHE.get(cls)
+        if figure_type is None:
+            figure_type = _FIGURE_MODULES.get(cls.__module__.split('.', 1)[0])
+            if figure_type is None:
+                raise ValueError(f"Unsupported figure type: {cls}")
+            _TYPE_CACHE[cls] = figure_type
+
+        return figure_type
     
-    def save_image(self, figure, filename: str, format: str = 'png', 
+    def save_image(self, figure, filename: str, format: str = 'png',
                   quality: str = 'high', metadata: Optional[Dict[str, Any]] = None,
-                  auto_timestamp: bool = False) -> str:
+                  auto_timestamp: bool = False,
+                  _shared_timestamp: Optional[str] = None) -> str:
         """Universal image saving across all plotting libraries
         
         Args:
@@ -57,32 +98,30 @@ class UniversalImageEngine:
         # Process filename
         final_filename = self._process_filename(filename, format, auto_timestamp)
         
-        # Ensure output directory exists
+        # Ensure output directory exists (once per directory, not per image)
         output_dir = os.path.dirname(final_filename)
-        if output_dir:
+        if output_dir and output_dir not in self._created_dirs:
             Path(output_dir).mkdir(parents=True, exist_ok=True)
+            self._created_dirs.add(output_dir)
         
-        # Add default metadata
-        if metadata is None:
-            metadata = {}
-        
+        # Add default metadata (copy so shared dicts survive concurrent saves)
+        metadata = {} if metadata is None else dict(metadata)
+
         metadata.update({
             'created_by': 'Universal Image Engine',
             'style_version': self.style_format.schema['version'],
             'figure_type': figure_type,
-            'timestamp': datetime.now().isoformat()
+            'timestamp': _shared_timestamp or datetime.now().isoformat()
         })
         
         # Save using appropriate adapter
+        adapter = getattr(self, f"{figure_type}_adapter")
         if figure_type == 'matplotlib':
-            self.matplotlib_adapter.save_figure(figure, final_filename, format, quality, metadata)
-        elif figure_type == 'plotly':
-            self.plotly_adapter.save_figure(figure, final_filename, format, quality, metadata)
-        elif figure_type == 'bokeh':
-            self.bokeh_adapter.save_figure(figure, final_filename, format, quality, metadata)
+            with self._mpl_lock:
+                adapter.save_figure(figure, final_filename, format, quality, metadata)
         else:
-            raise ValueError(f"Unsupported figure type: {figure_type}")
-        
+            adapter.save_figure(figure, final_filename, format, quality, metadata)
+
         return final_filename
     
     def _process_filename(self, filename: str, format: str, auto_timestamp: bool) -> str:
@@ -95,11 +134,9 @@ class UniversalImageEngine:
         if auto_timestamp:
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             base_name = f"{base_name}_{timestamp}"
-        
+
         # Add format extension
-        final_filename = f"{base_name}.{format}"
-        
-        return final_filename
+        return _ensure_ext(base_name, format)
     
     def save_multiple(self, figures: list, base_filename: str, format: str = 'png',
                      quality: str = 'high', metadata: Optional[Dict[str, Any]] = None) -> list:
@@ -116,19 +153,24 @@ class UniversalImageEngine:
             list: List of saved filenames
         """
         
-        saved_files = []
-        
-        for i, figure in enumerate(figures, 1):
-            # Create numbered filename
-            base_name = os.path.splitext(base_filename)[0]
-            numbered_filename = f"{base_name}_{i:03d}"
-            
-            saved_file = self.save_image(
-                figure, numbered_filename, format, quality, metadata
+        if not figures:
+            return []
+
+        # One timestamp for the whole batch instead of a clock read per figure
+        timestamp = datetime.now().isoformat()
+        base_name = os.path.splitext(base_filename)[0]
+
+        def _save(item):
+            i, figure = item
+            return self.save_image(
+                figure, f"{base_name}_{i:03d}", format, quality, metadata,
+                _shared_timestamp=timestamp
             )
-            saved_files.append(saved_file)
-        
-        return saved_files
+
+        # Image export is I/O-bound (disk, kaleido/selenium subprocesses), so
+        # overlap the saves; executor.map preserves input order
+        with ThreadPoolExecutor(max_workers=min(8, len(figures))) as executor:
+            return list(executor.map(_save, enumerate(figures, 1)))
     
     def get_supported_formats(self, figure_type: str = None) -> Dict[str, list]:
         """Get supported formats for each figure type"""
@@ -158,14 +200,28 @@ class UniversalImageEngine:
             dict: Mapping of names to saved filenames
         """
         
-        saved_files = {}
-        
-        for name, figure in figures_dict.items():
+        if not figures_dict:
+            return {}
+
+        # Create the shared output directory up front so each save_image call
+        # skips the mkdir syscall
+        if output_dir and output_dir not in self._created_dirs:
+            Path(output_dir).mkdir(parents=True, exist_ok=True)
+            self._created_dirs.add(output_dir)
+
+        # One timestamp for the whole batch instead of a clock read per figure
+        timestamp = datetime.now().isoformat()
+
+        def _save(item):
+            name, figure = item
             filename = os.path.join(output_dir, name)
-            saved_file = self.save_image(figure, filename, format, quality)
-            saved_files[name] = saved_file
-        
-        return saved_files
+            return name, self.save_image(figure, filename, format, quality,
+                                         _shared_timestamp=timestamp)
+
+        # Image export is I/O-bound (disk, kaleido/selenium subprocesses), so
+        # overlap the saves; executor.map preserves input order
+        with ThreadPoolExecutor(max_workers=min(8, len(figures_dict))) as executor:
+            return dict(executor.map(_save, figures_dict.items()))
 
 
 def save_image(figure, filename: str, format: str = 'png', 
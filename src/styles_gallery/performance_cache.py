@@ -1,16 +1,81 @@
 """Performance optimization and caching for styles gallery"""
 
+import itertools
 import time
 import hashlib
 import json
-import weakref
+import pickle
+from collections import OrderedDict, deque
 from typing import Dict, Any, Optional, Tuple, Union
 from functools import wraps, lru_cache
 from datetime import datetime, timedelta
 import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
-from .formats.common_format import UniversalStyleFormat
+from .formats import UniversalStyleFormat
+
+# Resolved once at module load; every template-cache miss previously
+# re-ran the import statement inside get_template
+try:
+    from .templates.template_manager import StyleTemplateManager
+except ImportError:
+    StyleTemplateManager = None
+
+# One process handle for memory reporting instead of importing psutil and
+# constructing a Process per report
+try:
+    import psutil
+    _process = psutil.Process()
+except ImportError:
+    _process = None
+
+# orjson encodes key material several times faster than stdlib json and
+# returns bytes directly, skipping the .encode() round trip
+try:
+    import orjson
+
+    def _dumps_key(obj: Any) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_SORT_KEYS, default=str)
+except ImportError:
+    def _dumps_key(obj: Any) -> bytes:
+        return json.dumps(obj, sort_keys=True, default=str).encode()
+
+# Cache keys need speed, not cryptographic strength: prefer xxhash (xxh3),
+# then blake3, before falling back to stdlib blake2b
+try:
+    import xxhash
+
+    def _new_hasher():
+        return xxhash.xxh3_64()
+except ImportError:
+    try:
+        import blake3
+
+        def _new_hasher():
+            return blake3.blake3()
+    except ImportError:
+        def _new_hasher():
+            return hashlib.blake2b(digest_size=8)
+
+
+def _hash_hex(data: bytes) -> str:
+    hasher = _new_hasher()
+    hasher.update(data)
+    return hasher.hexdigest()
+
+
+class _HashWriter:
+    """File-like sink that feeds every written chunk straight into a hasher,
+    so pickling for key generation never materializes the full blob"""
+
+    __slots__ = ('hasher',)
+
+    def __init__(self, hasher):
+        self.hasher = hasher
+
+    def write(self, data) -> None:
+        self.hasher.update(data)
 
 
 class StyleCache:
@@ -19,9 +84,29 @@ class StyleCache:
     def __init__(self, max_size: int = 1000, ttl_seconds: int = 3600):
         self.max_size = max_size
         self.ttl_seconds = ttl_seconds
-        self.cache: Dict[str, Dict[str, Any]] = {}
-        self.access_times: Dict[str, float] = {}
-        self.lock = threading.RLock()
+        # Ordered least- to most-recently-used, so lookup, insert, and
+        # eviction are all O(1) instead of scanning for the LRU key
+        # Entries are (value, timestamp_ns) tuples: a fraction of the
+        # footprint of a dict per entry at batch cache sizes
+        self.cache: 'OrderedDict[str, Tuple[Any, int]]' = OrderedDict()
+        # Tiny 64-bit Bloom filter (2 derived bit positions per key) that
+        # rejects never-seen keys before the dict probe; false positives
+        # just fall through to the normal lookup, and bits from evicted
+        # keys stay set until clear()
+        self._bloom = 0
+        # Plain Lock: nothing re-enters, and reads skip it entirely
+        self.lock = threading.Lock()
+    
+    @property
+    def ttl_seconds(self) -> int:
+        """Entry time-to-live in seconds"""
+        return self._ttl_ns // 1_000_000_000
+    
+    @ttl_seconds.setter
+    def ttl_seconds(self, value: int) -> None:
+        # TTL math runs on monotonic nanosecond ints: immune to wall-clock
+        # jumps and cheaper to compare than floats
+        self._ttl_ns = int(value * 1_000_000_000)
         
     def _generate_key(self, *args, **kwargs) -> str:
         """Generate cache key from arguments"""
@@ -29,54 +114,63 @@ class StyleCache:
             'args': args,
             'kwargs': sorted(kwargs.items())
         }
-        key_str = json.dumps(key_data, sort_keys=True, default=str)
-        return hashlib.md5(key_str.encode()).hexdigest()
+        # Stream pickle output through the hasher chunk by chunk; falls
+        # back to JSON text for values pickle cannot handle
+        try:
+            hasher = _new_hasher()
+            pickle.Pickler(_HashWriter(hasher),
+                           protocol=pickle.HIGHEST_PROTOCOL).dump(key_data)
+            return hasher.hexdigest()
+        except (TypeError, AttributeError, pickle.PicklingError):
+            return _hash_hex(_dumps_key(key_data))
     
     def get(self, key: str) -> Optional[Any]:
         """Get item from cache"""
+        # Bloom gate: a definite non-member is answered with two shifts
+        # and an AND, skipping the dict hash/probe on cold keys
+        h = hash(key)
+        if (self._bloom >> (h & 63)) & (self._bloom >> ((h >> 6) & 63)) & 1 == 0:
+            return None
+        
+        # Optimistic lock-free read: dict lookups are atomic under the GIL
+        # and entries are immutable once stored, so the read-heavy hot path
+        # only takes the lock to update recency or expire an entry
+        entry = self.cache.get(key)
+        if entry is None:
+            return None
+        value, timestamp = entry
+        
+        # Check TTL
+        if time.monotonic_ns() - timestamp > self._ttl_ns:
+            with self.lock:
+                self.cache.pop(key, None)
+            return None
+        
+        # Mark as most recently used (entry may have been evicted between
+        # the optimistic read and acquiring the lock)
         with self.lock:
-            if key not in self.cache:
-                return None
-            
-            entry = self.cache[key]
-            
-            # Check TTL
-            if time.time() - entry['timestamp'] > self.ttl_seconds:
-                del self.cache[key]
-                del self.access_times[key]
-                return None
-            
-            # Update access time
-            self.access_times[key] = time.time()
-            return entry['value']
+            if key in self.cache:
+                self.cache.move_to_end(key)
+        return value
     
     def put(self, key: str, value: Any) -> None:
         """Put item in cache"""
         with self.lock:
-            # Evict if at capacity
-            if len(self.cache) >= self.max_size and key not in self.cache:
-                self._evict_lru()
+            if key in self.cache:
+                self.cache.move_to_end(key)
+            elif len(self.cache) >= self.max_size:
+                # Evict the least recently used entry
+                self.cache.popitem(last=False)
             
-            self.cache[key] = {
-                'value': value,
-                'timestamp': time.time()
-            }
-            self.access_times[key] = time.time()
-    
-    def _evict_lru(self) -> None:
-        """Evict least recently used item"""
-        if not self.access_times:
-            return
-        
-        lru_key = min(self.access_times.keys(), key=lambda k: self.access_times[k])
-        del self.cache[lru_key]
-        del self.access_times[lru_key]
+            self.cache[key] = (value, time.monotonic_ns())
+            h = hash(key)
+            self._bloom |= (1 << (h & 63)) | (1 << ((h >> 6) & 63))
     
     def clear(self) -> None:
         """Clear all cache entries"""
         with self.lock:
             self.cache.clear()
-            self.access_times.clear()
+            self._bloom = 0
     
     def size(self) -> int:
         """Get current cache size"""
@@ -85,10 +179,10 @@ class StyleCache:
     def stats(self) -> Dict[str, Any]:
         """Get cache statistics"""
         with self.lock:
-            now = time.time()
+            now = time.monotonic_ns()
             expired_count = sum(
-                1 for entry in self.cache.values()
-                if now - entry['timestamp'] > self.ttl_seconds
+                1 for _, timestamp in self.cache.values()
+                if now - timestamp > self._ttl_ns
             )
             
             return {
@@ -102,17 +196,34 @@ class StyleCache:
 # Global cache instance
 _style_cache = StyleCache()
 
+# Process-unique tokens for fingerprinted instances: unlike id(), a token
+# is never reused after an instance dies, so its cache entries can never
+# be served to a new instance allocated at the same address
+_instance_tokens = itertools.count()
+
 
 def cached_style(ttl_seconds: int = 3600):
     """Decorator for caching style operations"""
     def decorator(func):
         @wraps(func)
         def wrapper(*args, **kwargs):
-            # Generate cache key
-            cache_key = _style_cache._generate_key(func.__name__, *args, **kwargs)
-            
-            # Try to get from cache
-            cached_result = _style_cache.get(cache_key)
+            # Generate cache key; instances carrying a schema fingerprint
+            # (OptimizedStyleFormat) key on their unique token plus write
+            # counter instead of serializing the whole schema on every call
+            if args and hasattr(args[0], '_cache_token'):
+                cache_key = (func.__name__, args[0]._cache_token,
+                             args[0]._schema_version,
+                             args[1:], tuple(sorted(kwargs.items())))
+                # The probe is what hashes the tuple; unhashable arguments
+                # fall back to the serialized key path, which handles them
+                try:
+                    cached_result = _style_cache.get(cache_key)
+                except TypeError:
+                    cache_key = _style_cache._generate_key(func.__name__, *args, **kwargs)
+                    cached_result = _style_cache.get(cache_key)
+            else:
+                cache_key = _style_cache._generate_key(func.__name__, *args, **kwargs)
+                cached_result = _style_cache.get(cache_key)
             if cached_result is not None:
                 return cached_result
             
@@ -128,121 +239,127 @@ def cached_style(ttl_seconds: int = 3600):
 class OptimizedStyleFormat(UniversalStyleFormat):
     """Performance-optimized version of UniversalStyleFormat"""
     
+    # __weakref__ keeps instances weak-referenceable now that the whole
+    # hierarchy is slotted
+    __slots__ = ('_schema_version', '_cache_token', '__weakref__')
+    
     def __init__(self, schema: Optional[Dict[str, Any]] = None):
         super().__init__(schema)
-        self._computed_cache = {}
-        self._schema_hash = self._compute_schema_hash()
+        # Monotonic write counter: comparing a small int replaces
+        # re-serializing and hashing the schema to detect changes
+        self._schema_version = 0
+        self._cache_token = next(_instance_tokens)
     
-    def _compute_schema_hash(self) -> str:
-        """Compute hash of schema for cache invalidation"""
-        schema_str = json.dumps(self.schema, sort_keys=True)
-        return hashlib.md5(schema_str.encode()).hexdigest()
+    # The inherited accessors already memoize into self._computed; stacking
+    # @cached_style and a second per-instance dict on top of that meant a
+    # "hit" still paid a full schema rehash per call. Reads now touch a
+    # single cache layer and invalidation happens only on explicit mutation.
     
-    def _invalidate_cache_if_needed(self) -> None:
-        """Invalidate cache if schema has changed"""
-        current_hash = self._compute_schema_hash()
-        if current_hash != self._schema_hash:
-            self._computed_cache.clear()
-            self._schema_hash = current_hash
+    # A fresh property rather than UniversalStyleFormat.schema.setter: when
+    # the Cython build of the base class is active, schema is a getset
+    # descriptor with no .setter/.fset to extend
+    @property
+    def schema(self) -> Dict[str, Any]:
+        """Underlying style schema dictionary"""
+        return self._schema
     
-    @cached_style(ttl_seconds=3600)
-    def get_figure_size(self) -> Tuple[float, float]:
-        """Cached version of get_figure_size"""
-        self._invalidate_cache_if_needed()
-        
-        cache_key = 'figure_size'
-        if cache_key in self._computed_cache:
-            return self._computed_cache[cache_key]
-        
-        result = super().get_figure_size()
-        self._computed_cache[cache_key] = result
-        return result
+    @schema.setter
+    def schema(self, value: Dict[str, Any]) -> None:
+        self.set_schema(value)
+        self._schema_version += 1
     
-    @cached_style(ttl_seconds=3600)
-    def get_font_config(self) -> Dict[str, Any]:
-        """Cached version of get_font_config"""
-        self._invalidate_cache_if_needed()
-        
-        cache_key = 'font_config'
-        if cache_key in self._computed_cache:
-            return self._computed_cache[cache_key]
-        
-        result = super().get_font_config()
-        self._computed_cache[cache_key] = result
-        return result
+    def update_schema(self, updates: Dict[str, Any]) -> None:
+        """Apply in-place schema updates and invalidate cached values"""
+        self._own_schema().update(updates)
+        self.invalidate()
     
-    @cached_style(ttl_seconds=3600)
-    def get_color_config(self) -> Dict[str, Any]:
-        """Cached version of get_color_config"""
-        self._invalidate_cache_if_needed()
-        
-        cache_key = 'color_config'
-        if cache_key in self._computed_cache:
-            return self._computed_cache[cache_key]
-        
-        result = super().get_color_config()
-        self._computed_cache[cache_key] = result
-        return result
+    def invalidate(self) -> None:
+        """Clear memoized values and bump the version after external mutation"""
+        self._computed.clear()
+        self._schema_version += 1
 
 
 class LazyStyleLoader:
     """Lazy loading for style templates and configurations"""
     
     def __init__(self):
-        self._loaded_templates = {}
-        self._template_refs = weakref.WeakValueDictionary()
+        # Single owned LRU+TTL cache of ready style instances; the old
+        # trio of _loaded_templates / weakref dict / load_times could
+        # desynchronize, forcing redundant re-wraps after GC
+        self._cache = StyleCache(max_size=64, ttl_seconds=7200)
         self.load_times = {}
+        # (load_time, name) in insertion order; lets the age sweep stop at
+        # the first unexpired entry instead of scanning every template
+        self._load_order = deque()
+        self._manager = None
+        self._lock = threading.Lock()
     
-    def get_template(self, template_name: str) -> Optional[UniversalStyleFormat]:
+    def _get_manager(self):
+        """Create the template manager once and reuse it across loads"""
+        if self._manager is None:
+            if StyleTemplateManager is None:
+                return None  # Template manager not available
+            with self._lock:
+                if self._manager is None:
+                    self._manager = StyleTemplateManager()
+        return self._manager
+    
+    def get_template(self, template_name: str,
+                     manager=None) -> Optional[UniversalStyleFormat]:
         """Lazily load and cache template"""
-        # Check weak reference cache first
-        if template_name in self._template_refs:
-            return self._template_refs[template_name]
-        
-        # Check if we've loaded it before
-        if template_name in self._loaded_templates:
-            style = OptimizedStyleFormat(self._loaded_templates[template_name])
-            self._template_refs[template_name] = style
+        style = self._cache.get(template_name)
+        if style is not None:
             return style
         
-        # Load template (this would interface with template manager)
-        try:
-            from .templates.template_manager import StyleTemplateManager
-            manager = StyleTemplateManager()
-            template_schema = manager.templates.get(template_name)
-            
-            if template_schema:
-                self._loaded_templates[template_name] = template_schema
-                self.load_times[template_name] = time.time()
-                
-                style = OptimizedStyleFormat(template_schema)
-                self._template_refs[template_name] = style
-                return style
-            
-        except ImportError:
-            pass  # Template manager not available
+        # Load from the (shared) template manager
+        if manager is None:
+            manager = self._get_manager()
+        if manager is None:
+            return None
+        
+        template_schema = manager.templates.get(template_name)
+        if template_schema:
+            style = OptimizedStyleFormat(template_schema)
+            with self._lock:
+                load_time = time.monotonic_ns()
+                self._cache.put(template_name, style)
+                self.load_times[template_name] = load_time
+                self._load_order.append((load_time, template_name))
+            return style
         
         return None
     
     def preload_templates(self, template_names: list) -> None:
         """Preload multiple templates for better performance"""
-        for template_name in template_names:
-            self.get_template(template_name)
+        if not template_names:
+            return
+        
+        # Resolve the manager once up front, then fan the loads out; they
+        # are I/O-adjacent (module import, dict copies) so threads overlap
+        manager = self._get_manager()
+        with ThreadPoolExecutor(max_workers=min(8, len(template_names))) as executor:
+            list(executor.map(
+                lambda name: self.get_template(name, manager=manager),
+                template_names
+            ))
     
     def clear_old_templates(self, max_age_seconds: int = 7200) -> int:
         """Clear templates older than specified age"""
-        current_time = time.time()
-        old_templates = []
-        
-        for template_name, load_time in self.load_times.items():
-            if current_time - load_time > max_age_seconds:
-                old_templates.append(template_name)
+        current_time = time.monotonic_ns()
+        max_age_ns = max_age_seconds * 1_000_000_000
+        evicted = 0
         
-        for template_name in old_templates:
-            self._loaded_templates.pop(template_name, None)
-            self.load_times.pop(template_name, None)
+        # The deque is ordered by load time, so only the expired prefix is
+        # ever walked; the stamp check skips entries reloaded since
+        while self._load_order and current_time - self._load_order[0][0] > max_age_ns:
+            load_time, template_name = self._load_order.popleft()
+            if self.load_times.get(template_name) == load_time:
+                with self._cache.lock:
+                    self._cache.cache.pop(template_name, None)
+                self.load_times.pop(template_name, None)
+                evicted += 1
         
-        return len(old_templates)
+        return evicted
 
 
 class PerformanceMonitor:
@@ -250,20 +367,19 @@ class PerformanceMonitor:
     
     def __init__(self):
         self.metrics = {
-            'style_creation_times': [],
+            # Bounded ring buffer: appends past capacity drop the oldest
+            # sample in O(1) instead of list.pop(0)'s O(N) shift
+            'style_creation_times': deque(maxlen=1000),
             'cache_hits': 0,
             'cache_misses': 0,
             'template_loads': 0,
             'image_saves': 0
         }
-        self.start_time = time.time()
+        self.start_time = time.monotonic_ns()
     
     def record_style_creation(self, creation_time: float) -> None:
         """Record style creation time"""
         self.metrics['style_creation_times'].append(creation_time)
-        # Keep only last 1000 measurements
-        if len(self.metrics['style_creation_times']) > 1000:
-            self.metrics['style_creation_times'].pop(0)
     
     def record_cache_hit(self) -> None:
         """Record cache hit"""
@@ -283,7 +399,7 @@ class PerformanceMonitor:
     
     def get_performance_report(self) -> Dict[str, Any]:
         """Get comprehensive performance report"""
-        uptime = time.time() - self.start_time
+        uptime = (time.monotonic_ns() - self.start_time) / 1_000_000_000
         creation_times = self.metrics['style_creation_times']
         
         report = {
@@ -312,18 +428,15 @@ class PerformanceMonitor:
     
     def _get_memory_usage(self) -> Dict[str, Any]:
         """Get memory usage information"""
-        try:
-            import psutil
-            process = psutil.Process()
-            memory_info = process.memory_info()
-            
-            return {
-                'rss_mb': memory_info.rss / 1024 / 1024,
-                'vms_mb': memory_info.vms / 1024 / 1024,
-                'available': True
-            }
-        except ImportError:
+        if _process is None:
             return {'available': False, 'error': 'psutil not installed'}
+        
+        memory_info = _process.memory_info()
+        return {
+            'rss_mb': memory_info.rss >> 20,
+            'vms_mb': memory_info.vms >> 20,
+            'available': True
+        }
 
 
 # Global instances
@@ -351,10 +464,7 @@ def get_cache_stats() -> Dict[str, Any]:
     """Get comprehensive cache statistics"""
     return {
         'style_cache': _style_cache.stats(),
-        'template_cache': {
-            'loaded_templates': len(_lazy_loader._loaded_templates),
-            'weak_references': len(_lazy_loader._template_refs)
-        },
+        'template_cache': _lazy_loader._cache.stats(),
         'performance': _performance_monitor.get_performance_report()
     }
 
@@ -362,8 +472,7 @@ def get_cache_stats() -> Dict[str, Any]:
 def clear_all_caches():
     """Clear all caches to free memory"""
     _style_cache.clear()
-    _lazy_loader._loaded_templates.clear()
-    _lazy_loader._template_refs.clear()
+    _lazy_loader._cache.clear()
     _lazy_loader.load_times.clear()
 
 
@@ -371,9 +480,9 @@ def performance_benchmark(func):
     """Decorator to benchmark function performance"""
     @wraps(func)
     def wrapper(*args, **kwargs):
-        start_time = time.time()
+        start_time = time.perf_counter()
         result = func(*args, **kwargs)
-        end_time = time.time()
+        end_time = time.perf_counter()
         
         execution_time = end_time - start_time
         _performance_monitor.record_style_creation(execution_time)
@@ -0,0 +1,33 @@
+"""Helpers for freezing built-in template dictionaries.
+
+Every consumer treats the built-in template tables as read-only, so the
+style modules wrap them in mapping proxies at import. Frozen templates can
+be fingerprinted by identity instead of re-serialized, and accidental
+mutation of a shared built-in raises instead of corrupting later lookups.
+"""
+
+import sys
+from types import MappingProxyType
+from typing import Any
+
+
+def freeze(value: Any) -> Any:
+    """Recursively wrap dicts in read-only mapping proxies, interning
+    strings so the many repeated colors and font names across templates
+    collapse to single shared objects"""
+    if isinstance(value, dict):
+        return MappingProxyType({freeze(k): freeze(v) for k, v in value.items()})
+    if isinstance(value, list):
+        return tuple(freeze(v) for v in value)
+    if isinstance(value, str):
+        return sys.intern(value)
+    return value
+
+
+def thaw(value: Any) -> Any:
+    """Recursively convert a frozen template back to mutable dicts/lists"""
+    if isinstance(value, (MappingProxyType, dict)):
+        return {k: thaw(v) for k, v in value.items()}
+    if isinstance(value, (tuple, list)):
+        return [thaw(v) for v in value]
+    return value
@@ -1,5 +1,7 @@
 """Academic publication style templates"""
 
+from ._freeze import freeze
+
 ACADEMIC_STYLES = {
     "ieee_standard": {
         "version": "1.0",
@@ -150,4 +152,8 @@ ACADEMIC_STYLES = {
             "grid": {"alpha": 0.4, "linewidth": 0.8}
         }
     }
-}
\ No newline at end of file
+}
+
+# Consumers treat these templates as read-only; freezing lets caches
+# fingerprint them by identity and guards the shared copies against mutation
+ACADEMIC_STYLES = freeze(ACADEMIC_STYLES)
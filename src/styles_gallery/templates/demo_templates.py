@@ -1,5 +1,9 @@
 """Demo-compliant style templates for immediate use"""
 
+from functools import lru_cache
+
+from ._freeze import freeze
+
 # DEMO STANDARD TEMPLATES - IMMEDIATE USE FOR DEMO
 DEMO_TEMPLATES = {
     "demo_scientific": {
@@ -159,10 +163,17 @@ DEMO_TEMPLATES = {
     }
 }
 
+# Read-only like the other built-in template tables (see templates/_freeze.py)
+DEMO_TEMPLATES = freeze(DEMO_TEMPLATES)
+
 # DEMO QUICK-APPLY FUNCTIONS
+# These take no arguments, so each builds its literal once and every later
+# call is a pointer return; dict results come back frozen so the shared
+# copy cannot be mutated by one caller under another
+@lru_cache(maxsize=1)
 def get_demo_matplotlib_config():
     """Get matplotlib configuration for demo compliance"""
-    return {
+    return freeze({
         'figure.figsize': (6.4, 4.8),
         'figure.dpi': 150,
         'figure.facecolor': '#ffffff',
@@ -178,10 +189,10 @@ def get_demo_matplotlib_config():
         'legend.fontsize': 9,
         'grid.alpha': 0.3,
         'grid.linewidth': 0.5,
-        'grid.color': '#cccccc',
-        'axes.prop_cycle': 'color: #1f77b4, #ff7f0e, #2ca02c, #d62728'
-    }
+        'grid.color': '#cccccc'
+    })
 
+@lru_cache(maxsize=1)
 def get_demo_css_styles():
     """Get CSS styles for demo compliance"""
     return """
@@ -264,17 +275,22 @@ def get_demo_css_styles():
     }
     """
 
+@lru_cache(maxsize=1)
+def _demo_rcparams():
+    """Assemble the complete rc dict, including the color cycler, once"""
+    from cycler import cycler
+    
+    config = dict(get_demo_matplotlib_config())
+    config['axes.prop_cycle'] = cycler('color', ['#1f77b4', '#ff7f0e', '#2ca02c', '#d62728'])
+    return config
+
 def apply_demo_matplotlib_style():
     """Apply demo-compliant matplotlib styling immediately"""
     try:
         import matplotlib.pyplot as plt
         
-        config = get_demo_matplotlib_config()
-        plt.rcParams.update(config)
-        
-        # Set color cycle properly
-        from cycler import cycler
-        plt.rcParams['axes.prop_cycle'] = cycler('color', ['#1f77b4', '#ff7f0e', '#2ca02c', '#d62728'])
+        # One update call validates every key exactly once per process
+        plt.rcParams.update(_demo_rcparams())
         
         print("✅ Demo matplotlib styling applied")
         return True
@@ -283,9 +299,10 @@ def apply_demo_matplotlib_style():
         print("⚠️ matplotlib not available")
         return False
 
+@lru_cache(maxsize=1)
 def get_demo_color_constants():
     """Get demo color constants for use in code"""
-    return {
+    return freeze({
         'PRIMARY': '#1f77b4',
         'SECONDARY': '#ff7f0e', 
         'SUCCESS': '#2ca02c',
@@ -294,7 +311,7 @@ def get_demo_color_constants():
         'BACKGROUND': '#ffffff',
         'TEXT': '#333333',
         'GRID': '#cccccc'
-    }
+    })
 
 # EMERGENCY DEMO FIXES
 EMERGENCY_MATPLOTLIB_FIX = """
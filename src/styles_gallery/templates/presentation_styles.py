@@ -1,5 +1,7 @@
 """Presentation and business style templates"""
 
+from ._freeze import freeze
+
 PRESENTATION_STYLES = {
     "corporate_presentation": {
         "version": "1.0",
@@ -150,4 +152,7 @@ PRESENTATION_STYLES = {
             "grid": {"alpha": 0.2, "linewidth": 0.3}
         }
     }
-}
\ No newline at end of file
+}
+
+# Read-only like the other built-in template tables (see templates/_freeze.py)
+PRESENTATION_STYLES = freeze(PRESENTATION_STYLES)
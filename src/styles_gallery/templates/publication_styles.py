@@ -1,5 +1,7 @@
 """Publication and report style templates"""
 
+from ._freeze import freeze
+
 PUBLICATION_STYLES = {
     "scientific_report": {
         "version": "1.0",
@@ -180,4 +182,7 @@ PUBLICATION_STYLES = {
             "grid": {"alpha": 0.2, "linewidth": 0.3}
         }
     }
-}
\ No newline at end of file
+}
+
+# Read-only like the other built-in template tables (see templates/_freeze.py)
+PUBLICATION_STYLES = freeze(PUBLICATION_STYLES)
@@ -1,28 +1,93 @@
 """Template manager for style templates"""
 
+import itertools
+import json
+import re
+from collections import ChainMap
+from types import MappingProxyType
 from typing import Dict, List, Optional, Any
-from ..formats.common_format import UniversalStyleFormat
+from ..formats import UniversalStyleFormat
 from .academic_styles import ACADEMIC_STYLES
+from .demo_templates import DEMO_TEMPLATES
 from .presentation_styles import PRESENTATION_STYLES
 from .publication_styles import PUBLICATION_STYLES
+from ._freeze import thaw
+
+# All built-in templates merged once at import (same precedence as the old
+# per-instance update sequence); every manager shares this view instead of
+# re-copying seventeen templates into a fresh dict per instantiation
+_BUILTIN = MappingProxyType({
+    **DEMO_TEMPLATES,
+    **ACADEMIC_STYLES,
+    **PRESENTATION_STYLES,
+    **PUBLICATION_STYLES
+})
+_BUILTIN_NAMES = frozenset(_BUILTIN)
+
+# Minimum structure a custom template must provide
+_REQUIRED_FIELDS = frozenset(("version", "figure", "fonts", "colors", "layout"))
+
+# Use-case keyword recommendations, shared by every manager; the compiled
+# alternation finds all matching keywords in one scan instead of one
+# substring search per keyword
+_USE_CASE_KEYWORDS = {
+    "journal": ["ieee_standard", "nature_style", "acs_journal", "high_impact_journal"],
+    "publication": ["scientific_report", "book_chapter", "white_paper"],
+    "presentation": ["corporate_presentation", "slide_deck", "infographic"],
+    "thesis": ["thesis_style", "book_chapter"],
+    "poster": ["conference_poster", "infographic"],
+    "web": ["web_display", "dashboard_style"],
+    "report": ["scientific_report", "technical_manual", "white_paper"],
+    "business": ["corporate_presentation", "dashboard_style", "white_paper"]
+}
+_RECOMMEND_RE = re.compile(
+    "|".join(sorted(_USE_CASE_KEYWORDS, key=len, reverse=True))
+)
+
+
+def _overlay(base: Any, mods: Dict[str, Any]) -> Dict[str, Any]:
+    """Merge mods over base, cloning only the spine of dicts the
+    modifications touch and sharing untouched subtrees by reference"""
+    out = dict(base)
+    for key, value in mods.items():
+        existing = out.get(key)
+        if isinstance(existing, (dict, MappingProxyType)) and isinstance(value, dict):
+            out[key] = _overlay(existing, value)
+        else:
+            out[key] = value
+    return out
+
+
+def _mods_key(value):
+    """Canonicalize a modifications dict into a hashable tuple"""
+    if isinstance(value, dict):
+        return tuple(sorted((k, _mods_key(v)) for k, v in value.items()))
+    if isinstance(value, list):
+        return tuple(_mods_key(v) for v in value)
+    return value
 
 
 class StyleTemplateManager:
     """Manager for pre-built style templates"""
     
     def __init__(self):
-        self.templates = {}
-        self._load_builtin_templates()
-    
-    def _load_builtin_templates(self):
-        """Load all built-in templates"""
-        from .demo_templates import DEMO_TEMPLATES
-        
-        # Load demo templates first (highest priority)
-        self.templates.update(DEMO_TEMPLATES)
-        self.templates.update(ACADEMIC_STYLES)
-        self.templates.update(PRESENTATION_STYLES)
-        self.templates.update(PUBLICATION_STYLES)
+        # Custom templates layer over the shared built-ins; writes through
+        # self.templates land in the custom dict only
+        self._custom: Dict[str, Any] = {}
+        self.templates = ChainMap(self._custom, _BUILTIN)
+        # Memo of constructed style instances, keyed by template name or
+        # (name, canonicalized modifications); cleared when the custom
+        # layer changes. Cached styles share their schema, as built-in
+        # lookups always have.
+        self._style_cache: Dict[Any, UniversalStyleFormat] = {}
+        # Lazily built (name, searchable text) pairs; rebuilt after the
+        # custom layer changes
+        self._search_index: Optional[tuple] = None
+        # Lazily built category -> names map; same invalidation rules
+        self._by_category_cache: Optional[Dict[str, List[str]]] = None
+        # Serialized JSON per exported template; export output is
+        # invariant until the template layer changes
+        self._export_cache: Dict[str, str] = {}
     
     def list_templates(self, category: Optional[str] = None) -> List[str]:
         """List available templates, optionally filtered by category
@@ -36,10 +101,8 @@ class StyleTemplateManager:
         if category is None:
             return list(self.templates.keys())
         
-        return [
-            name for name, template in self.templates.items()
-            if template.get("metadata", {}).get("category") == category
-        ]
+        # Served from the cached category index instead of a full scan
+        return list(self._category_map().get(category, ()))
     
     def get_template(self, name: str) -> Optional[UniversalStyleFormat]:
         """Get a template by name
@@ -50,10 +113,13 @@ class StyleTemplateManager:
         Returns:
             UniversalStyleFormat or None: Template style format
         """
-        template_schema = self.templates.get(name)
-        if template_schema:
-            return UniversalStyleFormat(template_schema)
-        return None
+        style = self._style_cache.get(name)
+        if style is None:
+            template_schema = self.templates.get(name)
+            if not template_schema:
+                return None
+            style = self._style_cache[name] = UniversalStyleFormat(template_schema)
+        return style
     
     def get_template_info(self, name: str) -> Optional[Dict[str, Any]]:
         """Get template metadata and information
@@ -79,23 +145,24 @@ class StyleTemplateManager:
             list: List of matching template names
         """
         query_lower = query.lower()
-        matches = []
-        
-        for name, template in self.templates.items():
-            metadata = template.get("metadata", {})
-            
-            # Search in name, description, and use_case
-            searchable_fields = [
-                name.lower(),
-                metadata.get("name", "").lower(),
-                metadata.get("description", "").lower(),
-                metadata.get("use_case", "").lower()
-            ]
-            
-            if any(query_lower in field for field in searchable_fields):
-                matches.append(name)
-        
-        return matches
+        return [name for name, searchable in self._get_search_index()
+                if query_lower in searchable]
+    
+    def _get_search_index(self) -> tuple:
+        """Build the searchable-text index on first use"""
+        index = self._search_index
+        if index is None:
+            index = self._search_index = tuple(
+                (name, " ".join((
+                    name.lower(),
+                    metadata.get("name", "").lower(),
+                    metadata.get("description", "").lower(),
+                    metadata.get("use_case", "").lower()
+                )))
+                for name, template in self.templates.items()
+                for metadata in (template.get("metadata", {}),)
+            )
+        return index
     
     def get_templates_by_category(self) -> Dict[str, List[str]]:
         """Get templates organized by category
@@ -103,14 +170,19 @@ class StyleTemplateManager:
         Returns:
             dict: Dictionary mapping categories to template lists
         """
-        categories = {}
-        
-        for name, template in self.templates.items():
-            category = template.get("metadata", {}).get("category", "uncategorized")
-            if category not in categories:
-                categories[category] = []
-            categories[category].append(name)
-        
+        categories = self._category_map()
+        # Shallow-copy so callers cannot mutate the cached map
+        return {category: list(names) for category, names in categories.items()}
+    
+    def _category_map(self) -> Dict[str, List[str]]:
+        """Build the category index on first use"""
+        categories = self._by_category_cache
+        if categories is None:
+            categories = {}
+            for name, template in self.templates.items():
+                category = template.get("metadata", {}).get("category", "uncategorized")
+                categories.setdefault(category, []).append(name)
+            self._by_category_cache = categories
         return categories
     
     def get_recommended_templates(self, use_case: str) -> List[str]:
@@ -122,28 +194,14 @@ class StyleTemplateManager:
         Returns:
             list: List of recommended template names
         """
-        use_case_lower = use_case.lower()
-        recommendations = []
-        
-        # Define use case mappings
-        use_case_keywords = {
-            "journal": ["ieee_standard", "nature_style", "acs_journal", "high_impact_journal"],
-            "publication": ["scientific_report", "book_chapter", "white_paper"],
-            "presentation": ["corporate_presentation", "slide_deck", "infographic"],
-            "thesis": ["thesis_style", "book_chapter"],
-            "poster": ["conference_poster", "infographic"],
-            "web": ["web_display", "dashboard_style"],
-            "report": ["scientific_report", "technical_manual", "white_paper"],
-            "business": ["corporate_presentation", "dashboard_style", "white_paper"]
-        }
-        
-        # Find matching templates
-        for keyword, templates in use_case_keywords.items():
-            if keyword in use_case_lower:
-                recommendations.extend(templates)
-        
-        # Remove duplicates while preserving order
-        return list(dict.fromkeys(recommendations))
+        # One regex pass collects every matching keyword; mapping order
+        # keeps results stable, and chaining straight into dict.fromkeys
+        # dedups in a single pass without an intermediate list
+        found = set(_RECOMMEND_RE.findall(use_case.lower()))
+        return list(dict.fromkeys(itertools.chain.from_iterable(
+            templates for keyword, templates in _USE_CASE_KEYWORDS.items()
+            if keyword in found
+        )))
     
     def add_custom_template(self, name: str, template_schema: Dict[str, Any]) -> bool:
         """Add a custom template
@@ -159,11 +217,14 @@ class StyleTemplateManager:
             return False  # Template already exists
         
         # Validate basic structure
-        required_fields = ["version", "figure", "fonts", "colors", "layout"]
-        if not all(field in template_schema for field in required_fields):
+        if not _REQUIRED_FIELDS.issubset(template_schema):
             return False
         
-        self.templates[name] = template_schema
+        self._custom[name] = template_schema
+        self._style_cache.clear()
+        self._search_index = None
+        self._by_category_cache = None
+        self._export_cache.clear()
         return True
     
     def remove_custom_template(self, name: str) -> bool:
@@ -175,17 +236,15 @@ class StyleTemplateManager:
         Returns:
             bool: True if removed successfully
         """
-        # Check if it's a built-in template
-        builtin_templates = set()
-        builtin_templates.update(ACADEMIC_STYLES.keys())
-        builtin_templates.update(PRESENTATION_STYLES.keys())
-        builtin_templates.update(PUBLICATION_STYLES.keys())
-        
-        if name in builtin_templates:
+        if name in _BUILTIN_NAMES:
             return False  # Cannot remove built-in templates
         
-        if name in self.templates:
-            del self.templates[name]
+        if name in self._custom:
+            del self._custom[name]
+            self._style_cache.clear()
+            self._search_index = None
+            self._by_category_cache = None
+            self._export_cache.clear()
             return True
         
         return False
@@ -199,11 +258,15 @@ class StyleTemplateManager:
         Returns:
             str or None: JSON string of template
         """
-        template = self.templates.get(name)
-        if template:
-            import json
-            return json.dumps(template, indent=2)
-        return None
+        exported = self._export_cache.get(name)
+        if exported is None:
+            template = self.templates.get(name)
+            if not template:
+                return None
+            exported = self._export_cache[name] = json.dumps(
+                template, indent=2, default=dict
+            )
+        return exported
     
     def import_template(self, name: str, json_string: str) -> bool:
         """Import a template from JSON string
@@ -216,7 +279,6 @@ class StyleTemplateManager:
             bool: True if imported successfully
         """
         try:
-            import json
             template_schema = json.loads(json_string)
             return self.add_custom_template(name, template_schema)
         except (json.JSONDecodeError, ValueError):
@@ -233,24 +295,34 @@ class StyleTemplateManager:
         Returns:
             UniversalStyleFormat or None: Modified style format
         """
+        # The probe is what hashes the key, so the unhashable-value guard
+        # must cover it, not just the tuple construction
+        try:
+            cache_key = (template_name, _mods_key(modifications) if modifications else None)
+            style = self._style_cache.get(cache_key)
+        except TypeError:
+            cache_key = None  # Unhashable modification value; skip the memo
+            style = None
+        
+        if style is not None:
+            return style
+        
         base_template = self.templates.get(template_name)
         if not base_template:
             return None
         
-        # Create a copy of the template
-        import copy
-        modified_schema = copy.deepcopy(base_template)
-        
-        # Apply modifications if provided
         if modifications:
-            self._deep_update(modified_schema, modifications)
+            # Copy-on-write merge: allocations scale with the size of the
+            # modifications, not the whole template
+            modified_schema = _overlay(base_template, modifications)
+        else:
+            # No modifications: hand back a mutable copy of the template
+            modified_schema = thaw(base_template)
         
-        return UniversalStyleFormat(modified_schema)
-    
-    def _deep_update(self, base_dict: Dict[str, Any], update_dict: Dict[str, Any]) -> None:
-        """Recursively update a dictionary"""
-        for key, value in update_dict.items():
-            if key in base_dict and isinstance(base_dict[key], dict) and isinstance(value, dict):
-                self._deep_update(base_dict[key], value)
-            else:
-                base_dict[key] = value
\ No newline at end of file
+        style = UniversalStyleFormat(modified_schema)
+        if cache_key is not None:
+            # Bound the memo: distinct modification sets are usually few
+            if len(self._style_cache) > 128:
+                self._style_cache.clear()
+            self._style_cache[cache_key] = style
+        return style